@@ -1,5 +1,5 @@
-"""
-_summary_
-"""
-
-from .behav_classifier import BehavClassifier
+"""
+_summary_
+"""
+
+from .behav_classifier import BehavClassifier
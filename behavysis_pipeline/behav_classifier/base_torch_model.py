@@ -1,3 +1,4 @@
+import os
 from typing import Optional
 
 import numpy as np
@@ -5,7 +6,6 @@ import pandas as pd
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from sklearn.model_selection import train_test_split
 from torch.utils.data import DataLoader, Dataset, TensorDataset
 from tqdm import tqdm
 
@@ -19,12 +19,16 @@ class BaseTorchModel(nn.Module):
 
     def __init__(self, nfeatures: int, window_frames: int):
         super().__init__()
+        # Allowing TF32 tensor cores for float32 matmuls (Ampere+ GPUs)
+        torch.set_float32_matmul_precision("high")
         # Storing the input dimensions
         self.nfeatures = nfeatures
         self.window_frames = window_frames
         # Initialising the criterion and optimizer attributes
         self.criterion = None
         self.optimizer = None
+        # Compiled forward is built lazily (subclass layers don't exist yet)
+        self._compiled_forward = None
         # Setting the device (GPU or CPU)
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
@@ -36,14 +40,48 @@ class BaseTorchModel(nn.Module):
     def device(self, device):
         # Setting the device
         self._device = device
-        # Updating the model to the device
+        # Invalidating the compiled forward (it captures device placement)
+        self._compiled_forward = None
+        # Updating the model to the device (moves parameters in place;
+        # a no-op for parameters already there)
         if "cpu" in self.device.type:
             self.cpu()
         if "cuda" in self.device.type:
             self.cuda(self.device)
-        # TODO: allow different optimisers
+        # Rehoming the optimizer state instead of re-creating the optimizer -
+        # a fresh Adam would silently discard the moment estimates mid-training.
+        # (The param groups still hold the same Parameter objects, which
+        # .cpu()/.cuda() moved in place above.)
         if self.optimizer:
-            self.optimizer = optim.Adam(self.parameters())
+            for state in self.optimizer.state.values():
+                for k, v in state.items():
+                    if isinstance(v, torch.Tensor):
+                        state[k] = v.to(self.device)
+
+    def __getstate__(self):
+        # Dropping the compiled forward from pickled state - dynamo closures
+        # can't be pickled, and it's rebuilt lazily on first use anyway
+        state = self.__dict__.copy()
+        state["_compiled_forward"] = None
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Restoring the lazy slot (pickles from before it existed lack it)
+        self._compiled_forward = None
+
+    def compiled_forward(self):
+        """
+        Returns the torch.compile'd forward (building it on first use).
+        reduce-overhead mode fuses pointwise ops and replays CUDA graphs for
+        fixed-shape batches - the right fit for these small, launch-bound nets.
+        """
+        # getattr for models unpickled from before the cache attribute existed
+        if getattr(self, "_compiled_forward", None) is None:
+            self._compiled_forward = torch.compile(
+                self.forward, mode="reduce-overhead", dynamic=False
+            )
+        return self._compiled_forward
 
     def fit(
         self,
@@ -54,18 +92,24 @@ class BaseTorchModel(nn.Module):
         epochs: int,
         val_split: float,
     ):
-        # Split data into training and validation sets
-        ind_train, ind_val = train_test_split(
-            index, stratify=y[index], test_size=val_split
-        )
+        # Split data into training and validation sets.
+        # Direct two-class stratified split (binary labels), rather than
+        # sklearn's StratifiedShuffleSplit machinery inside every fit call
+        rng = np.random.default_rng()
+        pos = index[y[index] == 1]
+        neg = index[y[index] == 0]
+        rng.shuffle(pos)
+        rng.shuffle(neg)
+        k_pos = int(pos.shape[0] * val_split)
+        k_neg = int(neg.shape[0] * val_split)
+        ind_val = np.concatenate([pos[:k_pos], neg[:k_neg]])
+        ind_train = np.concatenate([pos[k_pos:], neg[k_neg:]])
         # Making data loaders
         train_ld = self.fit_loader(x, y, ind_train, batch_size=batch_size)
         val_ld = self.fit_loader(x, y, ind_val, batch_size=batch_size)
-        # Storing training history
-        history = pd.DataFrame(
-            index=pd.Index(np.arange(epochs), name="epoch"),
-            columns=["loss", "vloss"],
-        )
+        # Storing training history (plain preallocated array - pandas scalar
+        # assignment in the loop goes through the block manager every epoch)
+        history = np.empty((epochs, 2), dtype=np.float32)
         # Training the model
         for epoch in range(epochs):
             # Training model for one epoch
@@ -76,13 +120,15 @@ class BaseTorchModel(nn.Module):
             vloss = self._validate(val_ld, self.criterion)
             # Printing loss
             print(f"epochs: {epoch+1}/{epochs}")
-            print(f"loss: {loss:.3f}")
             print(f"loss: {loss:.3f}, vloss: {vloss:.3f}")
             # Storing loss
-            history.loc[epoch, "loss"] = loss
-            history.loc[epoch, "vloss"] = vloss
-        # Return history
-        return history
+            history[epoch] = (loss, vloss)
+        # Return history (wrapped as a DataFrame once)
+        return pd.DataFrame(
+            history,
+            index=pd.RangeIndex(epochs, name="epoch"),
+            columns=["loss", "vloss"],
+        )
 
     def _train_epoch(
         self,
@@ -94,10 +140,13 @@ class BaseTorchModel(nn.Module):
         # Switch the model to training mode
         self.train()
         # If verbose, then wrap the loader in tqdm to show a progress bar
+        # (rate-limited - per-batch bar updates are measurable on short steps)
         if verbose:
-            ld = tqdm(ld)
-        # To store the running loss
-        loss = 0.0
+            ld = tqdm(ld, mininterval=1.0, miniters=max(1, len(ld) // 100))
+        # Getting the compiled forward
+        forward = self.compiled_forward()
+        # To store the running loss (on-device, so no per-batch sync)
+        running_loss = torch.zeros((), device=self.device)
         # Iterate over the data batches
         for data in ld:
             # get the inputs
@@ -106,37 +155,54 @@ class BaseTorchModel(nn.Module):
             labels = labels.to(self.device)
             # zero the parameter gradients
             optimizer.zero_grad()
-            # forward pass
-            outputs = self(inputs)
-            # Calculate loss
-            loss = criterion(outputs, labels)
+            # forward pass (BF16 autocast on CUDA halves activation bandwidth;
+            # BF16 keeps fp32's range so no GradScaler is needed)
+            with torch.autocast(
+                device_type=self.device.type,
+                dtype=torch.bfloat16,
+                enabled=self.device.type == "cuda",
+            ):
+                outputs = forward(inputs)
+            # Calculate loss (in float32 - BCE is unsafe under autocast)
+            loss = criterion(outputs.float(), labels)
             # Calculate backward gradients
             loss.backward()
             # Update learning weights
             optimizer.step()
-            # print statistics
-            loss += loss.item()
-        # Scaling loss by number of batches
-        loss /= len(ld)
-        # Converting loss to float
-        loss = loss.cpu().detach().numpy().item()
-        # Returning loss
-        return loss
+            # Accumulating statistics on-device (.item() here would force a
+            # CUDA sync every batch)
+            running_loss += loss.detach()
+        # Scaling loss by number of batches and reading back once
+        return (running_loss / len(ld)).item()
 
     def _validate(self, ld: DataLoader, criterion: nn.Module) -> float:
-        # Calculating loss across an entire dataset (i.e. data loader)
-        # Running inference
-        outputs = self._inference(ld, verbose=False)
-        # Getting the actual labels
-        y = torch.concatenate([i[1] for i in ld]).to(self.device)
-        # Calculating the loss
-        loss = criterion(outputs, y)
-        # Scaling loss by number of batches
-        loss /= len(ld)
-        # Converting loss to float
-        loss = loss.cpu().numpy().item()
-        # Returning loss
-        return loss
+        # Calculating loss across an entire dataset (i.e. data loader) in a
+        # single on-device pass (mirrors _train_epoch, without the backward)
+        # Switch the model to evaluation mode
+        self.eval()
+        # Getting the compiled forward
+        forward = self.compiled_forward()
+        # To store the running loss (on-device, so no per-batch sync)
+        running_loss = torch.zeros((), device=self.device)
+        # No need to track gradients for validation, so wrap in no_grad()
+        with torch.no_grad():
+            # Iterate over the data batches
+            for data in ld:
+                # get the inputs
+                inputs, labels = data
+                inputs = inputs.to(self.device, non_blocking=True)
+                labels = labels.to(self.device, non_blocking=True)
+                # forward pass (BF16 autocast on CUDA)
+                with torch.autocast(
+                    device_type=self.device.type,
+                    dtype=torch.bfloat16,
+                    enabled=self.device.type == "cuda",
+                ):
+                    outputs = forward(inputs)
+                # Accumulating the loss on-device
+                running_loss += criterion(outputs.float(), labels)
+        # Scaling loss by number of batches and reading back once
+        return (running_loss / len(ld)).item()
 
     def predict(
         self,
@@ -156,31 +222,73 @@ class BaseTorchModel(nn.Module):
     def _inference(self, ld: DataLoader, verbose: bool = False) -> torch.Tensor:
         # Switch the model to evaluation mode
         self.eval()
-        # List to store the predictions
-        probs_all = torch.zeros((len(ld.dataset), 1), device=self.device)
+        # Preallocated host staging tensor for the predictions
+        # (pinned on CUDA so the D2H copies are async and don't stall the GPU)
+        on_cuda = self.device.type == "cuda"
+        probs_all = torch.empty(
+            (len(ld.dataset), 1), dtype=torch.float32, pin_memory=on_cuda
+        )
         # If verbose, then wrap the loader in tqdm to show a progress bar
+        # (rate-limited - per-batch bar updates are measurable on short steps)
         if verbose:
-            ld = tqdm(ld)
+            ld = tqdm(ld, mininterval=1.0, miniters=max(1, len(ld) // 100))
         # Keeping track of number of predictions made
         n = 0
+        # Getting the compiled forward
+        forward = self.compiled_forward()
         # No need to track gradients for inference, so wrap in no_grad()
         with torch.no_grad():
             # Iterate over the data batches
             for data in ld:
                 # Getting inputs
                 inputs = data[0]
-                inputs = inputs.to(self.device)
-                # Running inference to get outputs
-                probs = self(inputs)
-                # Storing the probabilities
-                probs_all[n : n + probs.shape[0]] = probs
+                inputs = inputs.to(self.device, non_blocking=True)
+                # Running inference to get outputs (BF16 autocast on CUDA)
+                with torch.autocast(
+                    device_type=self.device.type,
+                    dtype=torch.bfloat16,
+                    enabled=self.device.type == "cuda",
+                ):
+                    logits = forward(inputs)
+                # The model outputs raw logits; applying sigmoid once here
+                probs = torch.sigmoid(logits.float())
+                # Storing the probabilities (non-blocking D2H copy)
+                probs_all[n : n + probs.shape[0]].copy_(
+                    probs.detach(), non_blocking=True
+                )
                 n += probs.shape[0]
+        # Waiting for the outstanding async copies before handing back the data
+        if on_cuda:
+            torch.cuda.synchronize()
         return probs_all
 
+    def _window_dtype(self) -> torch.dtype:
+        # BF16 windows halve host memory and H2D bytes; autocast handles the
+        # mixed dtypes on CUDA, but the CPU path needs float32 inputs
+        return torch.bfloat16 if self.device.type == "cuda" else torch.float32
+
+    def _loader_opts(self) -> dict:
+        # Worker processes overlap batch collation with the train/infer step,
+        # and pinned host memory enables async H2D copies on CUDA
+        nworkers = max(1, (os.cpu_count() or 2) // 2)
+        return dict(
+            num_workers=nworkers,
+            pin_memory=self.device.type == "cuda",
+            persistent_workers=True,
+            prefetch_factor=2,
+        )
+
     @staticmethod
     def np_loader(*args, batch_size: int = 1, shuffle: bool = False) -> DataLoader:
+        # torch.from_numpy shares the numpy buffer (zero-copy); only a dtype
+        # mismatch pays for an actual conversion in ascontiguousarray
         return DataLoader(
-            TensorDataset(*(torch.tensor(i, dtype=torch.float) for i in args)),
+            TensorDataset(
+                *(
+                    torch.from_numpy(np.ascontiguousarray(i, dtype=np.float32))
+                    for i in args
+                )
+            ),
             batch_size=batch_size,
             shuffle=shuffle,
         )
@@ -192,10 +300,14 @@ class BaseTorchModel(nn.Module):
         index: Optional[np.ndarray] = None,
         batch_size: int = 1,
     ) -> DataLoader:
-        ds = MemoizedTimeSeriesDataset(
-            x=x, y=y, index=index, window_frames=self.window_frames
+        ds = TimeSeriesDataset(
+            x=x,
+            y=y,
+            index=index,
+            window_frames=self.window_frames,
+            window_dtype=self._window_dtype(),
         )
-        return DataLoader(ds, batch_size=batch_size, shuffle=True)
+        return DataLoader(ds, batch_size=batch_size, shuffle=True, **self._loader_opts())
         # return self.np_loader(x, y, batch_size=batch_size, shuffle=shuffle)
 
     def predict_loader(
@@ -204,15 +316,23 @@ class BaseTorchModel(nn.Module):
         index: Optional[np.ndarray] = None,
         batch_size: int = 1,
     ) -> DataLoader:
-        ds = TimeSeriesDataset(x=x, index=index, window_frames=self.window_frames)
-        return DataLoader(ds, batch_size=batch_size, shuffle=False)
+        ds = TimeSeriesDataset(
+            x=x,
+            index=index,
+            window_frames=self.window_frames,
+            window_dtype=self._window_dtype(),
+        )
+        return DataLoader(
+            ds, batch_size=batch_size, shuffle=False, **self._loader_opts()
+        )
         # return self.np_loader(x, batch_size=batch_size, shuffle=shuffle)
 
 
 class TimeSeriesDataset(Dataset):
     x: np.ndarray
-    y: np.ndarray
+    y: torch.Tensor
     index: np.ndarray
+    windows: torch.Tensor
     window_frames: int
 
     def __init__(
@@ -221,6 +341,7 @@ class TimeSeriesDataset(Dataset):
         y: Optional[np.ndarray] = None,
         index: Optional[np.ndarray] = None,
         window_frames: Optional[int] = 5,
+        window_dtype: torch.dtype = torch.float32,
     ):
         # Checking that the indexes are equal
         if y is not None:
@@ -229,12 +350,23 @@ class TimeSeriesDataset(Dataset):
         # 2 (indivs) * 8 (bpts) * 3 (coords) = 48 (columns)
         x = x[:, 48:]
         # Padding x (for frames on either side)
-        x = self.pad_arr(x, window_frames)
-        # Storing the data and labels
+        # (contiguous float32 so each window is a dense, half-size slice)
+        x = np.ascontiguousarray(self.pad_arr(x, window_frames), dtype=np.float32)
+        # Storing the data and labels (labels as a ready-made float tensor)
         self.x = x
-        self.y = y if y is not None else np.zeros(x.shape[0])
+        self.y = torch.as_tensor(
+            y if y is not None else np.zeros(x.shape[0]), dtype=torch.float
+        ).reshape(-1, 1)
         self.index = index if index is not None else np.arange(x.shape[0])
         self.window_frames = window_frames
+        # Precomputing all sliding windows once as a zero-copy view into the
+        # padded tensor (window i is x[i : i + 2 * window_frames + 1]).
+        # Unfolding axis 0 gives (samples, features, window) - the
+        # channels-first layout the Conv1d models consume directly.
+        x_t = torch.from_numpy(x)
+        if window_dtype != torch.float32:
+            x_t = x_t.to(window_dtype)
+        self.windows = x_t.unfold(0, 2 * window_frames + 1, 1)
 
     @staticmethod
     def pad_arr(x: np.ndarray, n: int) -> np.ndarray:
@@ -242,7 +374,7 @@ class TimeSeriesDataset(Dataset):
         synthesising data by padding with bfill and ffill
         for window size
         """
-        return np.concatenate([x[np.repeat(0, n)], x, x[np.repeat(-1, n)]])
+        return np.pad(x, [(n, n)] + [(0, 0)] * (x.ndim - 1), mode="edge")
 
     def __len__(self):
         return self.index.shape[0]
@@ -255,31 +387,11 @@ class TimeSeriesDataset(Dataset):
         """
         # Get the actual index (because `index` is the index of `self.index`)
         i = self.index[index]
-        # Calculate start and end of the window
-        # Because of data padding, the start is i and end is i + 2 * window_frames + 1
-        start = i
-        end = i + 2 * self.window_frames + 1
-        # Extract the window and label and convert to torch tensors
-        x_i = torch.tensor(self.x[start:end], dtype=torch.float).transpose(1, 0)
-        y_i = torch.tensor(self.y[i], dtype=torch.float).reshape(1)
+        # Extract the precomputed window and label - both are views into the
+        # tensors built at init, so no per-sample allocation or cast happens
+        # (because of data padding, window i is centred on original frame i)
+        x_i = self.windows[i]
+        y_i = self.y[i]
         # Return
         return x_i, y_i
 
-
-class MemoizedTimeSeriesDataset(TimeSeriesDataset):
-    def __init__(self, x, y, index, window_frames):
-        super().__init__(x, y, index, window_frames)
-        # For memoization
-        self.memo = {}
-
-    def __getitem__(self, index: int):
-        # Return memoized result
-        if index in self.memo:
-            return self.memo[index]
-        else:
-            # Otherwise, calculate
-            window, label = super().__getitem__(index)
-            # Memoize the result
-            self.memo[index] = window, label
-            # Return
-            return window, label
@@ -4,6 +4,7 @@ _summary_
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
@@ -23,6 +24,8 @@ from behavysis_core.constants import (
 from behavysis_core.data_models.pydantic_base_model import PydanticBaseModel
 from behavysis_core.mixins.behav_mixin import BehavMixin
 from behavysis_core.mixins.df_io_mixin import DFIOMixin
+from joblib import Parallel, delayed
+from pyarrow import feather
 from pydantic import ConfigDict
 from sklearn.metrics import (
     classification_report,
@@ -44,6 +47,31 @@ BEHAV_MODELS_SUBDIR = "behav_models"
 GENERIC_BEHAV_LABELS = ["nil", "behav"]
 
 
+@functools.lru_cache(maxsize=32)
+def load_preproc_cached(preproc_fp: str, mtime_ns: int):
+    """
+    Loads the preprocessor pipeline, memoized on (filepath, mtime) so
+    repeated preproc_x calls (e.g. pipeline_run in a loop over experiments)
+    skip the unpickle + file IO.
+    """
+    return joblib.load(preproc_fp)
+
+
+def copy_file(in_fp: str, out_fp: str) -> None:
+    """
+    Copies a single file into the model's data directory (worker task for
+    import_data). A real copy is made (never a hardlink) so later pipeline
+    runs rewriting the source file cannot mutate the imported training data.
+    """
+    # Removing any existing destination first: it may be a hardlink to the
+    # source from an older import, and copyfile refuses same-inode pairs
+    try:
+        os.unlink(out_fp)
+    except FileNotFoundError:
+        pass
+    shutil.copyfile(in_fp, out_fp)
+
+
 class BehavClassifierConfigs(PydanticBaseModel):
     """_summary_"""
 
@@ -58,7 +86,9 @@ class BehavClassifierConfigs(PydanticBaseModel):
     test_split: float = 0.2
     val_split: float = 0.2
     batch_size: int = 256
+    inference_batch_size: int = 4096
     epochs: int = 50
+    make_eval_plots: bool = True
 
 
 class BehavClassifier:
@@ -237,18 +267,21 @@ class BehavClassifier:
         y_dir :
             _description_
         """
-        # For each x and y directory
+        # Collecting all (in_fp, out_fp) copy jobs for the x and y directories
+        jobs = []
         for in_dir, out_dir in ((x_dir, self.x_dir), (y_dir, self.y_dir)):
             os.makedirs(out_dir, exist_ok=True)
-            # Copying each file to model root directory
-            for fp in os.listdir(in_dir):
-                in_fp = os.path.join(in_dir, fp)
-                out_fp = os.path.join(out_dir, fp)
+            for entry in os.scandir(in_dir):
+                out_fp = os.path.join(out_dir, entry.name)
                 # If not overwriting and out file already exists, then skip
                 if not overwrite and os.path.isfile(out_fp):
                     continue
-                # Copying file
-                shutil.copyfile(in_fp, out_fp)
+                jobs.append((entry.path, out_fp))
+        # Copying files in parallel (copies are independent and IO-bound,
+        # so threads overlap the disk latency)
+        Parallel(n_jobs=-1, prefer="threads")(
+            delayed(copy_file)(in_fp, out_fp) for in_fp, out_fp in jobs
+        )
 
     #################################################
     #            COMBINING DFS TO SINGLE DF
@@ -256,11 +289,15 @@ class BehavClassifier:
 
     @staticmethod
     def combine(src_dir):
-        data_dict = {
-            os.path.splitext(i)[0]: pd.read_feather(os.path.join(src_dir, i))
-            for i in os.listdir(os.path.join(src_dir))
-        }
-        return pd.concat(data_dict.values(), axis=0, keys=data_dict.keys())
+        # Reading the per-experiment feather files in parallel
+        # (pyarrow releases the GIL so threads scale well here)
+        files = os.listdir(src_dir)
+        names = [os.path.splitext(i)[0] for i in files]
+        dfs = Parallel(n_jobs=-1, prefer="threads")(
+            delayed(feather.read_feather)(os.path.join(src_dir, i), memory_map=True)
+            for i in files
+        )
+        return pd.concat(dfs, axis=0, keys=names)
 
     def combine_dfs(self) -> tuple[pd.DataFrame, pd.DataFrame]:
         """
@@ -278,9 +315,10 @@ class BehavClassifier:
         x = self.combine(self.x_dir)
         y = self.combine(self.y_dir)
         # Getting the intersection pf the x and y row indexes
+        # (positional take skips .loc's label re-validation on the MultiIndex)
         index = x.index.intersection(y.index)
-        x = x.loc[index]
-        y = y.loc[index]
+        x = x.take(x.index.get_indexer(index))
+        y = y.take(y.index.get_indexer(index))
         # Assert that x and y are the same length
         assert x.shape[0] == y.shape[0]
         # Returning the x and y dfs
@@ -295,6 +333,8 @@ class BehavClassifier:
         """
         __summary__
         """
+        # Downcasting to float32 (the torch models train in float32 anyway)
+        x = np.asarray(x, dtype=np.float32)
         # Making pipeline
         preproc_pipe = Pipeline(steps=[("MinMaxScaler", MinMaxScaler())])
         # Fitting pipeline
@@ -308,8 +348,10 @@ class BehavClassifier:
         The preprocessing steps are:
         - MinMax scaling (using previously fitted MinMaxScaler)
         """
-        # Loading in pipeline
-        preproc_pipe = joblib.load(preproc_fp)
+        # Downcasting to float32 (halves the windowed tensor's memory footprint)
+        x = np.asarray(x, dtype=np.float32)
+        # Loading in pipeline (memoized on the file's mtime)
+        preproc_pipe = load_preproc_cached(preproc_fp, os.stat(preproc_fp).st_mtime_ns)
         # Uses trained fit for preprocessing new data
         x = preproc_pipe.transform(x)
         # Returning df
@@ -331,18 +373,16 @@ class BehavClassifier:
             _description_
         """
         # Filtering out the prob and pred columns (in the `outcomes` level)
-        cols_filter = np.isin(
-            y.columns.get_level_values(BehavCN.OUTCOMES.value),
-            [BehavColumns.PROB.value, BehavColumns.PRED.value],
-            invert=True,
-        )
+        outcomes = y.columns.get_level_values(BehavCN.OUTCOMES.value)
+        cols_filter = ~outcomes.isin([BehavColumns.PROB.value, BehavColumns.PRED.value])
         y = y.loc[:, cols_filter]
         # Converting MultiIndex columns to single columns by
         # setting the column names from `(behav, outcome)` to `{behav}__{outcome}`
-        y.columns = [
-            f"{i[0]}" if i[1] == BehavColumns.ACTUAL.value else f"{i[0]}__{i[1]}"
-            for i in y.columns
-        ]
+        behavs = y.columns.get_level_values(0)
+        outcomes = y.columns.get_level_values(BehavCN.OUTCOMES.value)
+        y.columns = np.where(
+            outcomes == BehavColumns.ACTUAL.value, behavs, behavs + "__" + outcomes
+        )
         return y
 
     @staticmethod
@@ -354,10 +394,10 @@ class BehavClassifier:
         - Converting the MultiIndex columns from `(behav, outcome)` to `{behav}__{outcome}`,
         by expanding the `actual` and all specific outcome columns of each behav.
         """
-        # Imputing NaN values with 0
-        y = np.nan_to_num(y, nan=0)
-        # Setting -1 to 0 (i.e. "undecided" to "no behaviour")
-        y = np.maximum(y, 0)
+        # Imputing NaN values with 0 (in place - no extra copy)
+        y = np.nan_to_num(y, nan=0, copy=False)
+        # Setting -1 to 0 (i.e. "undecided" to "no behaviour"), in place
+        np.maximum(y, 0, out=y)
         # Returning arr
         return y
 
@@ -401,9 +441,12 @@ class BehavClassifier:
         """
         # Combining dfs from x and y directories (individual experiment data)
         x, y = self.combine_dfs()
+        # Converting x to a numpy array once (avoids sklearn re-wrapping the
+        # DataFrame in both the fit and transform below)
+        x = x.to_numpy()
         # Fitting the preprocessor pipeline
         self.preproc_x_fit(x, self.preproc_fp)
-        # Preprocessing x df
+        # Preprocessing x array
         x = self.preproc_x(x, self.preproc_fp)
         # Preprocessing y df
         y = self.wrangle_columns_y(y)[self.configs.behaviour_name].values
@@ -434,10 +477,12 @@ class BehavClassifier:
         # Getting entire index
         index = np.arange(x.shape[0])
         # Splitting into train and test indexes
+        # (only the int index goes through sklearn's shuffler - x and y are
+        # gathered downstream, so the feature matrix is never copied here)
         ind_train, ind_test = train_test_split(
             index,
             test_size=self.configs.test_split,
-            stratify=y[index],
+            stratify=y,
         )
         # Undersampling training index
         ind_train = self.undersample(
@@ -459,7 +504,9 @@ class BehavClassifier:
         x : np.ndarray
             Features array in the format: `(samples, window, features)`
         """
-        # Preprocessing x df
+        # Converting x to a numpy array once
+        x = x.to_numpy()
+        # Preprocessing x array
         x = self.preproc_x(x, self.preproc_fp)
         # Returning x
         return x
@@ -511,10 +558,11 @@ class BehavClassifier:
         index = x.index
         # Preprocessing features
         x = self.prepare_data(x)
-        # Loading the model
-        self.clf_load()
-        # Making predictions
-        y_eval = self.clf_predict(x, self.configs.batch_size)
+        # Loading the model (if not already in memory)
+        if self.clf is None:
+            self.clf_load()
+        # Making predictions (larger batches than training - forward pass only)
+        y_eval = self.clf_predict(x, self.configs.inference_batch_size)
         # Settings the index
         y_eval.index = index
         # Returning predictions
@@ -614,7 +662,9 @@ class BehavClassifier:
         """
         # Making eval df
         index = np.arange(x.shape[0]) if index is None else index
-        y_eval = self.clf_predict(x=x, index=index, batch_size=self.configs.batch_size)
+        y_eval = self.clf_predict(
+            x=x, index=index, batch_size=self.configs.inference_batch_size
+        )
         # Including `actual` lables in `y_eval`
         y_eval[self.configs.behaviour_name, BehavColumns.ACTUAL.value] = y[index]
         # Getting individual columns
@@ -623,21 +673,24 @@ class BehavClassifier:
         y_true = y_eval[self.configs.behaviour_name, BehavColumns.ACTUAL.value]
         # Making classification report
         report_dict = self.eval_report(y_true, y_pred)
-        # Making confusion matrix figure
-        metrics_fig = self.eval_conf_matr(y_true, y_pred)
-        # Making performance for different pcutoffs figure
-        pcutoffs_fig = self.eval_metrics_pcutoffs(y_true, y_prob)
-        # Logistic curve
-        logc_fig = self.eval_logc(y_true, y_prob)
-        # Saving data and figures
+        # Saving data
         DFIOMixin.write_feather(
             y_eval, os.path.join(self.eval_dir, f"{name}_eval.feather")
         )
         with open(os.path.join(self.eval_dir, f"{name}_report.json"), "w") as f:
             json.dump(report_dict, f)
-        metrics_fig.savefig(os.path.join(self.eval_dir, f"{name}_confm.png"))
-        pcutoffs_fig.savefig(os.path.join(self.eval_dir, f"{name}_pcutoffs.png"))
-        logc_fig.savefig(os.path.join(self.eval_dir, f"{name}_logc.png"))
+        # Making and saving figures (skipped for metrics-only headless runs)
+        metrics_fig = pcutoffs_fig = logc_fig = None
+        if self.configs.make_eval_plots:
+            # Making confusion matrix figure
+            metrics_fig = self.eval_conf_matr(y_true, y_pred)
+            # Making performance for different pcutoffs figure
+            pcutoffs_fig = self.eval_metrics_pcutoffs(y_true, y_prob)
+            # Logistic curve
+            logc_fig = self.eval_logc(y_true, y_prob)
+            metrics_fig.savefig(os.path.join(self.eval_dir, f"{name}_confm.png"))
+            pcutoffs_fig.savefig(os.path.join(self.eval_dir, f"{name}_pcutoffs.png"))
+            logc_fig.savefig(os.path.join(self.eval_dir, f"{name}_logc.png"))
         # Print classification report
         print(json.dumps(report_dict, indent=4))
         # Return evaluations
@@ -723,25 +776,34 @@ class BehavClassifier:
         """
         __summary__
         """
-        # Getting precision, recall and accuracy for different cutoffs
+        # Getting precision, recall and accuracy for different cutoffs.
+        # Sorting the probabilities once and counting tp/fp/fn/tn for every
+        # cutoff with cumsum + searchsorted (rather than a full
+        # classification_report per cutoff).
         pcutoffs = np.linspace(0, 1, 101)
-        # Measures
-        precisions = np.zeros(pcutoffs.shape[0])
-        recalls = np.zeros(pcutoffs.shape[0])
-        f1 = np.zeros(pcutoffs.shape[0])
-        accuracies = np.zeros(pcutoffs.shape[0])
-        for i, pcutoff in enumerate(pcutoffs):
-            y_pred = y_prob > pcutoff
-            report = classification_report(
-                y_true,
-                y_pred,
-                target_names=GENERIC_BEHAV_LABELS,
-                output_dict=True,
+        probs = y_prob.to_numpy()
+        order = np.argsort(probs)
+        sorted_probs = probs[order]
+        # cum_pos[k] is the number of positives among the k lowest probabilities
+        cum_pos = np.concatenate([[0], np.cumsum(y_true.to_numpy()[order])])
+        n = probs.size
+        total_pos = cum_pos[-1]
+        # Predicted positives for cutoff c are the probabilities strictly above c
+        k = np.searchsorted(sorted_probs, pcutoffs, side="right")
+        tp = total_pos - cum_pos[k]
+        fp = (n - k) - tp
+        fn = cum_pos[k]
+        tn = k - fn
+        # Measures (0 where undefined, matching classification_report)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            precisions = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+            recalls = tp / total_pos if total_pos > 0 else np.zeros(pcutoffs.shape[0])
+            f1 = np.where(
+                precisions + recalls > 0,
+                2 * precisions * recalls / (precisions + recalls),
+                0.0,
             )
-            precisions[i] = report[GENERIC_BEHAV_LABELS[1]]["precision"]
-            recalls[i] = report[GENERIC_BEHAV_LABELS[1]]["recall"]
-            f1[i] = report[GENERIC_BEHAV_LABELS[1]]["f1-score"]
-            accuracies[i] = report["accuracy"]
+        accuracies = (tp + tn) / n
         # Making figure
         fig, ax = plt.subplots(figsize=(10, 7))
         sns.lineplot(x=pcutoffs, y=precisions, label="precision", ax=ax)
@@ -763,20 +825,32 @@ class BehavClassifier:
                 "y_true_jitter": y_true + (0.2 * (np.random.rand(len(y_prob)) - 0.5)),
             }
         )
+        # Subsampling the scatter (matplotlib artist creation dominates beyond
+        # a few tens of thousands of points and adds nothing visually)
+        max_pts = 20000
+        if y_eval.shape[0] > max_pts:
+            plot_df = y_eval.sample(n=max_pts, random_state=0)
+        else:
+            plot_df = y_eval
         fig, ax = plt.subplots(figsize=(10, 7))
         sns.scatterplot(
-            data=y_eval,
+            data=plot_df,
             x="y_prob",
             y="y_true_jitter",
             marker=".",
             s=10,
             linewidth=0,
             alpha=0.2,
+            rasterized=True,
             ax=ax,
         )
         # Making line of ratio of y_true outcomes for each y_prob
+        # (ECDF: one sort + binary searches, rather than a scan per cutoff)
         pcutoffs = np.linspace(0, 1, 101)
-        ratios = np.vectorize(lambda i: np.mean(i > y_eval["y_prob"]))(pcutoffs)
+        sorted_probs = np.sort(y_eval["y_prob"].to_numpy())
+        ratios = (
+            np.searchsorted(sorted_probs, pcutoffs, side="left") / sorted_probs.size
+        )
         sns.lineplot(x=pcutoffs, y=ratios, ax=ax)
         # Returning figure
         return fig
@@ -788,16 +862,13 @@ class BehavClassifier:
         """
         y_eval = pd.DataFrame({"y_true": y_true, "y_pred": y_pred})
         y_eval["ids"] = np.cumsum(y_eval["y_true"] != y_eval["y_true"].shift())
-        # Getting the proportion of correct predictions for each bout
-        y_eval_grouped = y_eval.groupby("ids")
-        y_eval_summary = pd.DataFrame(
-            y_eval_grouped.apply(lambda x: (x["y_pred"] == x["y_true"]).mean()),
-            columns=["proportion"],
-        )
-        y_eval_summary["actual_bout"] = y_eval_grouped.apply(
-            lambda x: x["y_true"].mean()
+        y_eval["match"] = y_eval["y_pred"] == y_eval["y_true"]
+        # Getting the proportion of correct predictions (and size) for each bout
+        y_eval_summary = y_eval.groupby("ids").agg(
+            proportion=("match", "mean"),
+            actual_bout=("y_true", "mean"),
+            bout_len=("y_true", "size"),
         )
-        y_eval_summary["bout_len"] = y_eval_grouped.apply(lambda x: x.shape[0])
         y_eval_summary = y_eval_summary.sort_values("proportion")
         # # Making figure
         # fig, ax = plt.subplots(figsize=(10, 7))
@@ -1,6 +1,6 @@
-"""
-_summary_
-"""
-
-from behavysis_pipeline.pipeline.experiment import Experiment
-from behavysis_pipeline.pipeline.project import Project
+"""
+_summary_
+"""
+
+from behavysis_pipeline.pipeline.experiment import Experiment
+from behavysis_pipeline.pipeline.project import Project
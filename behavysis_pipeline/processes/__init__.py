@@ -1,17 +1,17 @@
-"""
-_summary_
-"""
-
-from behavysis_core.data_models import experiment_configs
-
-from .analyse import Analyse
-from .behav_analyse import BehavAnalyse
-from .calculate_params import CalculateParams
-from .classify_behaviours import ClassifyBehaviours
-from .evaluate import Evaluate
-from .export import Export
-from .extract_features import ExtractFeatures
-from .format_vid import FormatVid
-from .preprocess import Preprocess
-from .run_dlc import RunDLC
-from .update_configs import UpdateConfigs
+"""
+_summary_
+"""
+
+from behavysis_core.data_models import experiment_configs
+
+from .analyse import Analyse
+from .behav_analyse import BehavAnalyse
+from .calculate_params import CalculateParams
+from .classify_behaviours import ClassifyBehaviours
+from .evaluate import Evaluate
+from .export import Export
+from .extract_features import ExtractFeatures
+from .format_vid import FormatVid
+from .preprocess import Preprocess
+from .run_dlc import RunDLC
+from .update_configs import UpdateConfigs
@@ -1,297 +1,431 @@
-"""
-Functions have the following format:
-
-Parameters
-----------
-dlc_fp : str
-    The experiment's dlc file.
-configs_fp : str
-    The experiment's JSON configs file.
-
-Returns
--------
-str
-    The outcome of the process.
-"""
-
-import numpy as np
-import pandas as pd
-from behavysis_core.constants import Coords, IndivColumns
-from behavysis_core.data_models.experiment_configs import ExperimentConfigs
-from behavysis_core.mixins.keypoints_mixin import KeypointsMixin
-from pydantic import BaseModel, ConfigDict
-
-
-class CalculateParams:
-    """__summary__"""
-
-    @staticmethod
-    def start_frame(
-        dlc_fp: str,
-        configs_fp: str,
-    ) -> str:
-        """
-        Determine the starting frame of the experiment based on when the subject "likely" entered
-        the footage.
-
-        This is done by looking at a sliding window of time. If the median likelihood of the subject
-        existing in each frame across the sliding window is greater than the defined pcutoff, then
-        the determine this as the start time.
-
-        Notes
-        -----
-        The config file must contain the following parameters:
-        ```
-        - user
-            - calculate_params
-                - start_frame
-                    - window_sec: float
-                    - pcutoff: float
-        ```
-        """
-        outcome = ""
-        # Getting necessary config parameters
-        configs = ExperimentConfigs.read_json(configs_fp)
-        configs_filt = Model_check_exists(**configs.user.calculate_params.start_frame)
-        bpts = configs.get_ref(configs_filt.bodyparts)
-        window_sec = configs.get_ref(configs_filt.window_sec)
-        pcutoff = configs.get_ref(configs_filt.pcutoff)
-        fps = configs.auto.formatted_vid.fps
-        # Asserting that the necessary auto configs are valid
-        assert fps is not None, "fps is None. Please calculate fps first."
-        # Deriving more parameters
-        window_frames = int(np.round(fps * window_sec, 0))
-        # Loading dataframe
-        dlc_df = KeypointsMixin.clean_headings(KeypointsMixin.read_feather(dlc_fp))
-        # Getting likehoods of subject (given bpts) existing in each frame
-        df_lhoods = calc_likelihoods(dlc_df, bpts, window_frames)
-        # Determining start time. Start frame is the first frame of the rolling window's range
-        df_lhoods["exists"] = df_lhoods["rolling"] > pcutoff
-        # Getting when subject first and last exists in video
-        start_frame = 0
-        if np.all(df_lhoods["exists"] == 0):
-            # If subject never exists (i.e. no True values in exist column), then raise warning
-            outcome += (
-                "WARNING: The subject was not detected in any frames - using the first frame."
-                + "Please check the video.\n"
-            )
-        else:
-            start_frame = df_lhoods[df_lhoods["exists"]].index[0]
-        # Writing to configs
-        configs = ExperimentConfigs.read_json(configs_fp)
-        configs.auto.start_frame = start_frame
-        # configs.auto.start_sec = start_frame / fps
-        configs.write_json(configs_fp)
-        return outcome
-
-    @staticmethod
-    def stop_frame(dlc_fp: str, configs_fp: str) -> str:
-        """
-        Calculates the end time according to the following equation:
-
-        ```
-        stop_frame = start_frame + experiment_duration
-        ```
-
-        Notes
-        -----
-        The config file must contain the following parameters:
-        ```
-        TODO
-        ```
-        """
-        outcome = ""
-        # Getting necessary config parameters
-        configs = ExperimentConfigs.read_json(configs_fp)
-        configs_filt = Model_stop_frame(**configs.user.calculate_params.stop_frame)
-        dur_sec = configs.get_ref(configs_filt.dur_sec)
-        start_frame = configs.auto.start_frame
-        fps = configs.auto.formatted_vid.fps
-        auto_stop_frame = configs.auto.formatted_vid.total_frames
-        # Asserting that the necessary auto configs are valid
-        assert (
-            start_frame is not None
-        ), "start_frame is None. Please calculate start_frame first."
-        assert fps is not None, "fps is None. Please calculate fps first."
-        assert (
-            auto_stop_frame is not None
-        ), "total_frames is None. Please calculate total_frames first."
-        # Calculating stop_frame
-        dur_frames = int(dur_sec * fps)
-        stop_frame = start_frame + dur_frames
-        # Make a warning if the use-specified dur_sec is larger than the duration of the video.
-        if auto_stop_frame is None:
-            outcome += (
-                "WARNING: The length of the video itself has not been calculated yet."
-            )
-        elif stop_frame > auto_stop_frame:
-            outcome += (
-                "WARNING: The user specified dur_sec in the configs file is greater "
-                + "than the actual length of the video. Please check to see if this video is "
-                + "too short or if the dur_sec value is incorrect.\n"
-            )
-        # Writing to config
-        configs = ExperimentConfigs.read_json(configs_fp)
-        configs.auto.stop_frame = stop_frame
-        # configs.auto.stop_sec = stop_frame / fps
-        configs.write_json(configs_fp)
-        return outcome
-
-    @staticmethod
-    def exp_dur(dlc_fp: str, configs_fp: str) -> str:
-        """
-        Calculates the duration in seconds, from the time the specified bodyparts appeared
-        to the time they disappeared.
-        Appear/disappear is calculated from likelihood.
-        """
-        outcome = ""
-        # Getting necessary config parameters
-        configs = ExperimentConfigs.read_json(configs_fp)
-        configs_filt = Model_check_exists(**configs.user.calculate_params.exp_dur)
-        bpts = configs.get_ref(configs_filt.bodyparts)
-        window_sec = configs.get_ref(configs_filt.window_sec)
-        pcutoff = configs.get_ref(configs_filt.pcutoff)
-        fps = configs.auto.formatted_vid.fps
-        # Asserting that the necessary auto configs are valid
-        assert fps is not None, "fps is None. Please calculate fps first."
-        # Deriving more parameters
-        window_frames = int(np.round(fps * window_sec, 0))
-        # Loading dataframe
-        dlc_df = KeypointsMixin.clean_headings(KeypointsMixin.read_feather(dlc_fp))
-        # Getting likehoods of subject (given bpts) existing in each frame
-        df_lhoods = calc_likelihoods(dlc_df, bpts, window_frames)
-        # Determining start time. Start frame is the first frame of the rolling window's range
-        df_lhoods["exists"] = df_lhoods["rolling"] > pcutoff
-        # Getting when subject first and last exists in video
-        exp_dur_frames = 0
-        if np.all(df_lhoods["exists"] == 0):
-            # If subject never exists (i.e. no True values in exist column), then raise warning
-            outcome += (
-                "WARNING: The subject was not detected in any frames - using the first frame."
-                + "Please check the video.\n"
-            )
-        else:
-            start_frame = df_lhoods[df_lhoods["exists"]].index[0]
-            stop_frame = df_lhoods[df_lhoods["exists"]].index[-1]
-            exp_dur_frames = stop_frame - start_frame
-        # Writing to configs
-        configs = ExperimentConfigs.read_json(configs_fp)
-        configs.auto.exp_dur_frames = exp_dur_frames
-        # configs.auto.exp_dur_secs = exp_dur_frames / fps
-        configs.write_json(configs_fp)
-        return outcome
-
-    @staticmethod
-    def px_per_mm(dlc_fp: str, configs_fp: str) -> str:
-        """
-        Calculates the pixels per mm conversion for the video.
-
-        This is done by averaging the (x, y) coordinates of each corner,
-        finding the average x difference for the widths in pixels and y distance
-        for the heights in pixels,
-        dividing these pixel distances by their respective mm distances
-        (from the *config.json file),
-        and taking the average of these width and height conversions to estimate
-        the px to mm
-        conversion.
-
-        Notes
-        -----
-        The config file must contain the following parameters:
-        ```
-        - user
-            - calculate_params
-                - px_per_mm
-                    - point_a: str
-                    - point_b: str
-                    - dist_mm: float
-        ```
-        """
-        outcome = ""
-        # Getting necessary config parameters
-        configs = ExperimentConfigs.read_json(configs_fp)
-        configs_filt = Model_px_per_mm(**configs.user.calculate_params.px_per_mm)
-        pt_a = configs.get_ref(configs_filt.pt_a)
-        pt_b = configs.get_ref(configs_filt.pt_b)
-        pcutoff = configs.get_ref(configs_filt.pcutoff)
-        dist_mm = configs.get_ref(configs_filt.dist_mm)
-        # Loading dataframe
-        dlc_df = KeypointsMixin.clean_headings(KeypointsMixin.read_feather(dlc_fp))
-        # Imputing missing values with 0 (only really relevant for `likelihood` columns)
-        dlc_df = dlc_df.fillna(0)
-        # Checking that the two reference points are valid
-        KeypointsMixin.check_bpts_exist(dlc_df, [pt_a, pt_b])
-        # Getting calibration points (x, y, likelihood) values
-        pt_a_df = dlc_df[IndivColumns.SINGLE.value, pt_a]
-        pt_b_df = dlc_df[IndivColumns.SINGLE.value, pt_b]
-        # Interpolating points which are below a likelihood threshold (linear)
-        pt_a_df.loc[pt_a_df[Coords.LIKELIHOOD.value] < pcutoff] = np.nan
-        pt_a_df = pt_a_df.interpolate(method="linear", axis=0).bfill()
-        pt_b_df.loc[pt_b_df[Coords.LIKELIHOOD.value] < pcutoff] = np.nan
-        pt_b_df = pt_b_df.interpolate(method="linear", axis=0).bfill()
-        # Getting distance between calibration points
-        dist_px = np.nanmean(
-            np.sqrt(
-                np.square(pt_a_df["x"] - pt_b_df["x"])
-                + np.square(pt_a_df["y"] - pt_b_df["y"])
-            )
-        )
-        # Finding pixels per mm conversion, using the given arena width and height as calibration
-        px_per_mm = dist_px / dist_mm
-        # Saving to configs file
-        configs = ExperimentConfigs.read_json(configs_fp)
-        configs.auto.px_per_mm = px_per_mm
-        configs.write_json(configs_fp)
-        return outcome
-
-
-def calc_likelihoods(
-    df: pd.DataFrame,
-    bpts: list,
-    window_frames: int,
-):
-    """__summary__"""
-    # Imputing missing values with 0 (only really relevant for `likelihood` columns)
-    df = df.fillna(0)
-    # Checking that the two reference points are valid
-    KeypointsMixin.check_bpts_exist(df, bpts)
-    # Calculating likelihood of subject (given bpts) existing.
-    idx = pd.IndexSlice
-    df_lhoods = pd.DataFrame(index=df.index)
-    df_bpts_lhoods = df.loc[:, idx[:, bpts, Coords.LIKELIHOOD.value]]
-    df_lhoods["current"] = df_bpts_lhoods.apply(np.nanmedian, axis=1)
-    # Calculating likelihood of subject existing over time window
-    df_lhoods["rolling"] = (
-        df_lhoods["current"].rolling(window_frames, center=True).agg(np.nanmean)
-    )
-    # Returning df_lhoods
-    return df_lhoods
-
-
-class Model_stop_frame(BaseModel):
-    """_summary_"""
-
-    model_config = ConfigDict(extra="forbid")
-
-    dur_sec: float | str = 0
-
-
-class Model_check_exists(BaseModel):
-    """__summary__"""
-
-    model_config = ConfigDict(extra="forbid")
-
-    bodyparts: list[str] | str = []
-    window_sec: float | str = 0
-    pcutoff: float | str = 0
-
-
-class Model_px_per_mm(BaseModel):
-    """_summary_"""
-
-    model_config = ConfigDict(extra="forbid")
-
-    pt_a: str = "pt_a"
-    pt_b: str = "pt_b"
-    pcutoff: int | str = 0
-    dist_mm: float | str = 0
+"""
+Functions have the following format:
+
+Parameters
+----------
+dlc_fp : str
+    The experiment's dlc file.
+configs_fp : str
+    The experiment's JSON configs file.
+
+Returns
+-------
+str
+    The outcome of the process.
+"""
+
+import functools
+import os
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+from behavysis_core.constants import Coords, IndivColumns
+from behavysis_core.data_models.experiment_configs import ExperimentConfigs
+from behavysis_core.mixins.keypoints_mixin import KeypointsMixin
+from pydantic import BaseModel, ConfigDict
+
+
+class CalculateParams:
+    """__summary__"""
+
+    @staticmethod
+    def start_frame(
+        dlc_fp: str,
+        configs_fp: str,
+    ) -> str:
+        """
+        Determine the starting frame of the experiment based on when the subject "likely" entered
+        the footage.
+
+        This is done by looking at a sliding window of time. If the median likelihood of the subject
+        existing in each frame across the sliding window is greater than the defined pcutoff, then
+        the determine this as the start time.
+
+        Notes
+        -----
+        The config file must contain the following parameters:
+        ```
+        - user
+            - calculate_params
+                - start_frame
+                    - window_sec: float
+                    - pcutoff: float
+        ```
+        """
+        outcome = ""
+        # Getting necessary config parameters
+        configs = read_configs(configs_fp)
+        configs_filt = Model_check_exists(**configs.user.calculate_params.start_frame)
+        bpts = configs.get_ref(configs_filt.bodyparts)
+        window_sec = configs.get_ref(configs_filt.window_sec)
+        pcutoff = configs.get_ref(configs_filt.pcutoff)
+        fps = configs.auto.formatted_vid.fps
+        # Asserting that the necessary auto configs are valid
+        assert fps is not None, "fps is None. Please calculate fps first."
+        # Deriving more parameters
+        window_frames = int(round(fps * window_sec))
+        # Loading dataframe
+        dlc_df = KeypointsMixin.clean_headings(KeypointsMixin.read_feather(dlc_fp))
+        # Getting likehoods of subject (given bpts) existing in each frame
+        df_lhoods = calc_likelihoods(dlc_df, bpts, window_frames)
+        # Determining start time. Start frame is the first frame of the rolling window's range
+        exists_arr = df_lhoods["rolling"].to_numpy() > pcutoff
+        # Getting when subject first exists in video.
+        # np.argmax short-circuits on the first True; if that position is not
+        # True then there was no crossing at all.
+        start_frame = 0
+        hit = int(np.argmax(exists_arr))
+        if not exists_arr[hit]:
+            # If subject never exists (i.e. no True values in exist vector), then raise warning
+            outcome += (
+                "WARNING: The subject was not detected in any frames - using the first frame."
+                + "Please check the video.\n"
+            )
+        else:
+            start_frame = df_lhoods.index[hit]
+        # Writing to configs
+        configs.auto.start_frame = start_frame
+        # configs.auto.start_sec = start_frame / fps
+        configs.write_json(configs_fp)
+        return outcome
+
+    @staticmethod
+    def stop_frame(dlc_fp: str, configs_fp: str) -> str:
+        """
+        Calculates the end time according to the following equation:
+
+        ```
+        stop_frame = start_frame + experiment_duration
+        ```
+
+        Notes
+        -----
+        The config file must contain the following parameters:
+        ```
+        TODO
+        ```
+        """
+        outcome = ""
+        # Getting necessary config parameters
+        configs = read_configs(configs_fp)
+        configs_filt = Model_stop_frame(**configs.user.calculate_params.stop_frame)
+        dur_sec = configs.get_ref(configs_filt.dur_sec)
+        start_frame = configs.auto.start_frame
+        fps = configs.auto.formatted_vid.fps
+        auto_stop_frame = configs.auto.formatted_vid.total_frames
+        # Asserting that the necessary auto configs are valid
+        assert (
+            start_frame is not None
+        ), "start_frame is None. Please calculate start_frame first."
+        assert fps is not None, "fps is None. Please calculate fps first."
+        assert (
+            auto_stop_frame is not None
+        ), "total_frames is None. Please calculate total_frames first."
+        # Calculating stop_frame
+        dur_frames = int(dur_sec * fps)
+        stop_frame = start_frame + dur_frames
+        # Make a warning if the use-specified dur_sec is larger than the duration of the video.
+        if auto_stop_frame is None:
+            outcome += (
+                "WARNING: The length of the video itself has not been calculated yet."
+            )
+        elif stop_frame > auto_stop_frame:
+            outcome += (
+                "WARNING: The user specified dur_sec in the configs file is greater "
+                + "than the actual length of the video. Please check to see if this video is "
+                + "too short or if the dur_sec value is incorrect.\n"
+            )
+        # Writing to config
+        configs.auto.stop_frame = stop_frame
+        # configs.auto.stop_sec = stop_frame / fps
+        configs.write_json(configs_fp)
+        return outcome
+
+    @staticmethod
+    def exp_dur(dlc_fp: str, configs_fp: str) -> str:
+        """
+        Calculates the duration in seconds, from the time the specified bodyparts appeared
+        to the time they disappeared.
+        Appear/disappear is calculated from likelihood.
+        """
+        outcome = ""
+        # Getting necessary config parameters
+        configs = read_configs(configs_fp)
+        configs_filt = Model_check_exists(**configs.user.calculate_params.exp_dur)
+        bpts = configs.get_ref(configs_filt.bodyparts)
+        window_sec = configs.get_ref(configs_filt.window_sec)
+        pcutoff = configs.get_ref(configs_filt.pcutoff)
+        fps = configs.auto.formatted_vid.fps
+        # Asserting that the necessary auto configs are valid
+        assert fps is not None, "fps is None. Please calculate fps first."
+        # Deriving more parameters
+        window_frames = int(round(fps * window_sec))
+        # Loading dataframe
+        dlc_df = KeypointsMixin.clean_headings(KeypointsMixin.read_feather(dlc_fp))
+        # Getting likehoods of subject (given bpts) existing in each frame
+        df_lhoods = calc_likelihoods(dlc_df, bpts, window_frames)
+        # Determining start time. Start frame is the first frame of the rolling window's range
+        exists_arr = df_lhoods["rolling"].to_numpy() > pcutoff
+        # Getting when subject first and last exists in video
+        exp_dur_frames = 0
+        hits = np.flatnonzero(exists_arr)
+        if hits.shape[0] == 0:
+            # If subject never exists (i.e. no True values in exist vector), then raise warning
+            outcome += (
+                "WARNING: The subject was not detected in any frames - using the first frame."
+                + "Please check the video.\n"
+            )
+        else:
+            start_frame = df_lhoods.index[hits[0]]
+            stop_frame = df_lhoods.index[hits[-1]]
+            exp_dur_frames = stop_frame - start_frame
+        # Writing to configs
+        configs.auto.exp_dur_frames = exp_dur_frames
+        # configs.auto.exp_dur_secs = exp_dur_frames / fps
+        configs.write_json(configs_fp)
+        return outcome
+
+    @staticmethod
+    def px_per_mm(dlc_fp: str, configs_fp: str) -> str:
+        """
+        Calculates the pixels per mm conversion for the video.
+
+        This is done by averaging the (x, y) coordinates of each corner,
+        finding the average x difference for the widths in pixels and y distance
+        for the heights in pixels,
+        dividing these pixel distances by their respective mm distances
+        (from the *config.json file),
+        and taking the average of these width and height conversions to estimate
+        the px to mm
+        conversion.
+
+        Notes
+        -----
+        The config file must contain the following parameters:
+        ```
+        - user
+            - calculate_params
+                - px_per_mm
+                    - point_a: str
+                    - point_b: str
+                    - dist_mm: float
+        ```
+        """
+        outcome = ""
+        # Getting necessary config parameters
+        configs = read_configs(configs_fp)
+        configs_filt = Model_px_per_mm(**configs.user.calculate_params.px_per_mm)
+        pt_a = configs.get_ref(configs_filt.pt_a)
+        pt_b = configs.get_ref(configs_filt.pt_b)
+        pcutoff = configs.get_ref(configs_filt.pcutoff)
+        dist_mm = configs.get_ref(configs_filt.dist_mm)
+        # Loading dataframe
+        dlc_df = KeypointsMixin.clean_headings(KeypointsMixin.read_feather(dlc_fp))
+        # Checking that the two reference points are valid
+        KeypointsMixin.check_bpts_exist(dlc_df, [pt_a, pt_b])
+        # Getting calibration point columns by integer position, projecting
+        # just the six needed columns before any numeric work (avoids
+        # materializing the whole frame and repeated MultiIndex lookups)
+        pos = {col: i for i, col in enumerate(dlc_df.columns)}
+        single = IndivColumns.SINGLE.value
+        needed = [
+            (single, pt, coord)
+            for pt in (pt_a, pt_b)
+            for coord in (Coords.X.value, Coords.Y.value, Coords.LIKELIHOOD.value)
+        ]
+        values = dlc_df.iloc[:, [pos[col] for col in needed]].to_numpy(
+            dtype=np.float64
+        )
+        ax_raw, ay_raw, a_lhood, bx_raw, by_raw, b_lhood = values.T
+        # Interpolating points which are below a likelihood threshold (linear)
+        ax = interp_low_lhood(ax_raw, a_lhood, pcutoff)
+        ay = interp_low_lhood(ay_raw, a_lhood, pcutoff)
+        bx = interp_low_lhood(bx_raw, b_lhood, pcutoff)
+        by = interp_low_lhood(by_raw, b_lhood, pcutoff)
+        # Getting distance between calibration points
+        dist_px = mean_dist(ax, ay, bx, by)
+        # Finding pixels per mm conversion, using the given arena width and height as calibration
+        px_per_mm = dist_px / dist_mm
+        # Saving to configs file
+        configs.auto.px_per_mm = px_per_mm
+        configs.write_json(configs_fp)
+        return outcome
+
+    @staticmethod
+    def run_batch(
+        func_name: str,
+        fp_pairs: list[tuple[str, str]],
+        nprocs: int = 4,
+    ) -> list[str]:
+        """
+        Runs the named CalculateParams method over many experiments in parallel.
+
+        Each `(dlc_fp, configs_fp)` pair is independent (separate files), so the
+        method is simply mapped over the pairs with a multiprocessing Pool.
+
+        Parameters
+        ----------
+        func_name : str
+            The name of the CalculateParams method to run (e.g. "start_frame").
+        fp_pairs : list[tuple[str, str]]
+            The `(dlc_fp, configs_fp)` pair for each experiment.
+        nprocs : int
+            The number of processes to use.
+
+        Returns
+        -------
+        list[str]
+            The outcome of the process for each experiment.
+        """
+        method = getattr(CalculateParams, func_name)
+        with Pool(processes=nprocs) as p:
+            return p.starmap(method, fp_pairs)
+
+
+def read_configs(configs_fp: str) -> ExperimentConfigs:
+    """
+    Reads the experiment configs, memoized on (filepath, mtime) so repeated
+    reads of an unchanged file skip the JSON parse. A deep copy is returned
+    so callers can mutate the configs without poisoning the cache.
+    """
+    configs = _read_configs_cached(configs_fp, os.stat(configs_fp).st_mtime_ns)
+    return configs.model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_configs_cached(configs_fp: str, mtime_ns: int) -> ExperimentConfigs:
+    """__summary__"""
+    return ExperimentConfigs.read_json(configs_fp)
+
+
+def calc_likelihoods(
+    df: pd.DataFrame,
+    bpts: list,
+    window_frames: int,
+):
+    """__summary__"""
+    # Checking that the two reference points are valid
+    KeypointsMixin.check_bpts_exist(df, bpts)
+    # Calculating likelihood of subject (given bpts) existing.
+    # Getting the integer positions of the likelihood columns for the given bpts
+    # (avoids MultiIndex label resolution and non-contiguous copies).
+    # Memoized because pipelines process many files with an identical schema.
+    cols = likelihood_col_positions(tuple(df.columns), tuple(bpts))
+    # float32 is ample precision for probabilities in [0, 1] and halves
+    # the memory bandwidth of the reductions
+    lhoods_arr = df.iloc[:, cols].to_numpy(dtype=np.float32)
+    # Imputing missing values with 0 (on the projected likelihood columns only)
+    lhoods_arr = np.nan_to_num(lhoods_arr, nan=0, copy=False)
+    # NaNs have already been imputed above, so the plain (partition-based)
+    # median avoids np.nanmedian's per-row masking machinery
+    current = np.median(lhoods_arr, axis=1)
+    # Calculating likelihood of subject existing over time window
+    if window_frames <= 1:
+        # A one-frame window is the identity - skipping the rolling machinery
+        rolling = current
+    else:
+        rolling = rolling_mean_1d(current, window_frames)
+    # The whole reduction runs array-to-array; only the result is wrapped
+    # in a DataFrame (single construction, no per-column insertion)
+    return pd.DataFrame({"current": current, "rolling": rolling}, index=df.index)
+
+
+@functools.lru_cache(maxsize=32)
+def likelihood_col_positions(columns: tuple, bpts: tuple) -> np.ndarray:
+    """
+    Integer positions of the likelihood columns for the given bodyparts,
+    memoized per (column schema, bodyparts) pair so the column resolution is
+    paid once across repeated per-experiment calls.
+    """
+    bpts_set = set(bpts)
+    return np.array(
+        [
+            i
+            for i, col in enumerate(columns)
+            if col[-1] == Coords.LIKELIHOOD.value and col[-2] in bpts_set
+        ]
+    )
+
+
+def mean_dist(
+    ax: np.ndarray, ay: np.ndarray, bx: np.ndarray, by: np.ndarray
+) -> float:
+    """
+    Mean Euclidean distance between point a and point b across all frames
+    (NaN distances are ignored). Kept as a single kernel so the distance
+    computation makes one fused hypot pass with no extra temporaries.
+    """
+    return np.nanmean(np.hypot(ax - bx, ay - by))
+
+
+def interp_low_lhood(
+    vals: np.ndarray, lhoods: np.ndarray, pcutoff: float
+) -> np.ndarray:
+    """
+    Linearly interpolates the values whose likelihood is below pcutoff
+    (NumPy equivalent of the pandas mask + interpolate + bfill dance).
+    Values at either end are clamped to the nearest confident value.
+    """
+    # NaN likelihoods are treated as 0 (i.e. not confident)
+    good = np.nan_to_num(lhoods, nan=0) >= pcutoff
+    # If no confident points, then returning all NaN
+    if not good.any():
+        return np.full(vals.shape[0], np.nan)
+    xp = np.flatnonzero(good)
+    return np.interp(np.arange(vals.shape[0]), xp, vals[xp])
+
+
+def rolling_mean_1d(
+    arr: np.ndarray, window: int, out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Single-pass centered rolling mean over a 1-D array, using a cumulative sum
+    so each element is added and removed exactly once (O(N), no per-window
+    recompute). Matches `pd.Series.rolling(window, center=True).mean()` for
+    NaN-free input (positions with an incomplete window are NaN).
+
+    An `out` buffer (same length as `arr`) can be passed to reuse an existing
+    allocation across calls in per-experiment loops.
+    """
+    if out is None:
+        out = np.empty(arr.shape[0])
+    out[:] = np.nan
+    if window <= arr.shape[0]:
+        # Windowed sums via cumulative sum (sums[i] is the sum of arr[i : i + window])
+        csum = np.cumsum(arr, dtype=np.float64)
+        sums = csum[window - 1 :].copy()
+        sums[1:] -= csum[:-window]
+        # Centering the result (same alignment as pandas' center=True)
+        start = window - 1 - (window - 1) // 2
+        out[start : start + sums.shape[0]] = sums / window
+    return out
+
+
+class Model_stop_frame(BaseModel):
+    """_summary_"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    dur_sec: float | str = 0
+
+
+class Model_check_exists(BaseModel):
+    """__summary__"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    bodyparts: list[str] | str = []
+    window_sec: float | str = 0
+    pcutoff: float | str = 0
+
+
+class Model_px_per_mm(BaseModel):
+    """_summary_"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    pt_a: str = "pt_a"
+    pt_b: str = "pt_b"
+    pcutoff: int | str = 0
+    dist_mm: float | str = 0
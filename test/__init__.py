@@ -1,7 +1,7 @@
-"""
-_summary_
-
-```
-pytest --log-cli-level=INFO
-```
-"""
+"""
+_summary_
+
+```
+pytest --log-cli-level=INFO
+```
+"""